@@ -25,6 +25,9 @@ from pipeline.param.cross_validation_param import CrossValidationParam
 from pipeline.param.predict_param import PredictParam
 import json
 
+# same converge funcs the server side HomoNNParam accepts
+_CONVERGE_FUNCS = frozenset(("diff", "weight_diff", "abs"))
+
 
 class HomoNNParam(BaseParam):
     """
@@ -93,6 +96,19 @@ class HomoNNParam(BaseParam):
         supported_config_type = ["nn", "keras", "pytorch"]
         if self.config_type not in supported_config_type:
             raise ValueError(f"config_type should be one of {supported_config_type}")
+
+        if not isinstance(self.aggregate_every_n_epoch, int) or isinstance(self.aggregate_every_n_epoch, bool) \
+                or self.aggregate_every_n_epoch < 1:
+            raise ValueError(f"aggregate_every_n_epoch should be a positive integer, {self.aggregate_every_n_epoch} given")
+
+        if not isinstance(self.max_iter, int) or isinstance(self.max_iter, bool) or self.max_iter < 1:
+            raise ValueError(f"max_iter should be a positive integer, {self.max_iter} given")
+
+        if self.batch_size != -1 and (not isinstance(self.batch_size, int) or isinstance(self.batch_size, bool)
+                                      or self.batch_size < 1):
+            raise ValueError(
+                f"batch_size should be a positive integer or -1 represent for all data, {self.batch_size} given")
+
         self.early_stop = _parse_early_stop(self.early_stop)
         self.metrics = _parse_metrics(self.metrics)
         self.optimizer = _parse_optimizer(self.optimizer)
@@ -178,12 +194,14 @@ def _parse_early_stop(param):
     """
     default_eps = 0.0001
     if isinstance(param, str):
-        return SimpleNamespace(converge_func=param, eps=default_eps)
+        early_stop, eps = param, default_eps
     elif isinstance(param, dict):
         early_stop = param.get("early_stop", None)
         eps = param.get("eps", default_eps)
-        if not early_stop:
+        if not early_stop or not isinstance(early_stop, str):
             raise ValueError(f"early_stop config: {param} invalid")
-        return SimpleNamespace(converge_func=early_stop, eps=eps)
     else:
         raise ValueError(f"invalid type for early_stop: {type(param)}")
+    if early_stop not in _CONVERGE_FUNCS:
+        raise ValueError(f"early_stop should be one of {sorted(_CONVERGE_FUNCS)}, {early_stop} given")
+    return SimpleNamespace(converge_func=early_stop, eps=eps)
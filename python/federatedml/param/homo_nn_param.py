@@ -16,8 +16,7 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 #
-import copy
-import typing
+import sys
 from types import SimpleNamespace
 
 from federatedml.param.base_param import BaseParam
@@ -26,6 +25,32 @@ from federatedml.param.predict_param import PredictParam
 from federatedml.protobuf.generated import nn_model_meta_pb2
 import json
 
+# shared defaults, only ever cloned, never handed out or mutated
+_DEFAULT_PREDICT = PredictParam()
+_DEFAULT_CV = CrossValidationParam()
+
+_SUPPORTED_CONFIG_TYPE = ["nn", "keras", "pytorch"]
+
+# interned so downstream comparisons against literals hit the identity fast path
+_CONVERGE_FUNCS = frozenset(map(sys.intern, ("diff", "weight_diff", "abs")))
+
+
+def _is_int(v):
+    return isinstance(v, int) and not isinstance(v, bool)
+
+
+# (attribute, predicate, error message) rules applied by HomoNNParam.check, in order
+_CHECKS = (
+    ("config_type", lambda v: v in _SUPPORTED_CONFIG_TYPE,
+     "config_type should be one of nn, keras or pytorch, {} given"),
+    ("aggregate_every_n_epoch", lambda v: _is_int(v) and v >= 1,
+     "aggregate_every_n_epoch should be a positive integer, {} given"),
+    ("max_iter", lambda v: _is_int(v) and v >= 1,
+     "max_iter should be a positive integer, {} given"),
+    ("batch_size", lambda v: v == -1 or (_is_int(v) and v >= 1),
+     "batch_size should be a positive integer or -1 represent for all data, {} given"),
+)
+
 
 class HomoNNParam(BaseParam):
     """
@@ -62,15 +87,15 @@ class HomoNNParam(BaseParam):
                  aggregate_every_n_epoch: int = 1,
                  config_type: str = "nn",
                  nn_define: dict = None,
-                 optimizer: typing.Union[str, dict, SimpleNamespace] = 'SGD',
+                 optimizer: "str | dict | SimpleNamespace" = 'SGD',
                  loss: str = None,
-                 metrics: typing.Union[str, list] = None,
+                 metrics: "str | list" = None,
                  max_iter: int = 100,
                  batch_size: int = -1,
-                 early_stop: typing.Union[str, dict, SimpleNamespace] = "diff",
+                 early_stop: "str | dict | SimpleNamespace" = "diff",
                  encode_label: bool = False,
-                 predict_param=PredictParam(),
-                 cv_param=CrossValidationParam()):
+                 predict_param=None,
+                 cv_param=None):
         super(HomoNNParam, self).__init__()
 
         self.secure_aggregate = secure_aggregate
@@ -87,13 +112,15 @@ class HomoNNParam(BaseParam):
         self.optimizer = optimizer
         self.loss = loss
 
-        self.predict_param = copy.deepcopy(predict_param)
-        self.cv_param = copy.deepcopy(cv_param)
+        self.predict_param = _shallow_clone(_DEFAULT_PREDICT if predict_param is None else predict_param)
+        self.cv_param = _shallow_clone(_DEFAULT_CV if cv_param is None else cv_param)
 
     def check(self):
-        supported_config_type = ["nn", "keras","pytorch"]
-        if self.config_type not in supported_config_type:
-            raise ValueError(f"config_type should be one of {supported_config_type}")
+        for name, is_valid, msg in _CHECKS:
+            value = getattr(self, name)
+            if not is_valid(value):
+                raise ValueError(msg.format(value))
+
         self.early_stop = _parse_early_stop(self.early_stop)
         self.metrics = _parse_metrics(self.metrics)
         self.optimizer = _parse_optimizer(self.optimizer)
@@ -105,23 +132,17 @@ class HomoNNParam(BaseParam):
         pb.aggregate_every_n_epoch = self.aggregate_every_n_epoch
         pb.config_type = self.config_type
 
-        if self.config_type == "nn":
-            for layer in self.nn_define:
-                pb.nn_define.append(json.dumps(layer))
-        elif self.config_type == "keras":
+        if self.config_type == "keras":
             pb.nn_define.append(json.dumps(self.nn_define))
-        elif self.config_type == "pytorch":
-            for layer in self.nn_define:
-                pb.nn_define.append(json.dumps(layer))
+        elif self.config_type in ("nn", "pytorch"):
+            pb.nn_define.extend(json.dumps(layer) for layer in self.nn_define)
 
         pb.batch_size = self.batch_size
         pb.max_iter = self.max_iter
 
         pb.early_stop.early_stop = self.early_stop.converge_func
         pb.early_stop.eps = self.early_stop.eps
-
-        for metric in self.metrics:
-            pb.metrics.append(metric)
+        pb.metrics.extend(self.metrics)
 
         pb.optimizer.optimizer = self.optimizer.optimizer
         pb.optimizer.args = json.dumps(self.optimizer.kwargs)
@@ -129,34 +150,41 @@ class HomoNNParam(BaseParam):
         return pb
 
     def restore_from_pb(self, pb):
+        config_type = pb.config_type
+        if config_type == "keras":
+            nn_define = pb.nn_define[0]
+        elif config_type in ("nn", "pytorch"):
+            nn_define = self.nn_define + [json.loads(layer) for layer in pb.nn_define]
+        else:
+            raise ValueError(f"{config_type} is not supported")
+
+        early_stop = _parse_early_stop(dict(early_stop=pb.early_stop.early_stop, eps=pb.early_stop.eps))
+        args = pb.optimizer.args
+        optimizer = _parse_optimizer(dict(optimizer=pb.optimizer.optimizer, **(json.loads(args) if args else {})))
+
         self.secure_aggregate = pb.secure_aggregate
         self.encode_label = pb.encode_label
         self.aggregate_every_n_epoch = pb.aggregate_every_n_epoch
-        self.config_type = pb.config_type
-
-        if self.config_type == "nn":
-            for layer in pb.nn_define:
-                self.nn_define.append(json.loads(layer))
-        elif self.config_type == "keras":
-            self.nn_define = pb.nn_define[0]
-        elif self.config_type== "pytorch":
-            for layer in pb.nn_define:
-                self.nn_define.append(json.loads(layer))
-        else:
-            raise ValueError(f"{self.config_type} is not supported")
-
+        self.config_type = config_type
+        self.nn_define = nn_define
         self.batch_size = pb.batch_size
         self.max_iter = pb.max_iter
-
-        self.early_stop = _parse_early_stop(dict(early_stop=pb.early_stop.early_stop, eps=pb.early_stop.eps))
-
+        self.early_stop = early_stop
         self.metrics = list(pb.metrics)
-
-        self.optimizer = _parse_optimizer(dict(optimizer=pb.optimizer.optimizer, **json.loads(pb.optimizer.args)))
+        self.optimizer = optimizer
         self.loss = pb.loss
         return pb
 
 
+def _shallow_clone(param):
+    """
+    copy a flat param object without going through copy.deepcopy
+    """
+    clone = param.__class__.__new__(param.__class__)
+    clone.__dict__.update(param.__dict__)
+    return clone
+
+
 def _parse_metrics(param):
     """
     Examples:
@@ -184,17 +212,21 @@ def _parse_optimizer(param):
                 "learning_rate": 0.05
             }
     """
+    if isinstance(param, SimpleNamespace):
+        return param
     kwargs = {}
     if isinstance(param, str):
-        return SimpleNamespace(optimizer=param, kwargs=kwargs)
+        optimizer = param
     elif isinstance(param, dict):
         optimizer = param.get("optimizer", kwargs)
-        if not optimizer:
+        if not optimizer or not isinstance(optimizer, str):
             raise ValueError(f"optimizer config: {param} invalid")
         kwargs = {k: v for k, v in param.items() if k != "optimizer"}
-        return SimpleNamespace(optimizer=optimizer, kwargs=kwargs)
     else:
         raise ValueError(f"invalid type for optimize: {type(param)}")
+    # no allow-list here, the keras backend accepts any tf.keras.optimizers attribute
+    optimizer = sys.intern(optimizer)
+    return SimpleNamespace(optimizer=optimizer, kwargs=kwargs)
 
 
 def _parse_early_stop(param):
@@ -207,14 +239,19 @@ def _parse_early_stop(param):
                    "eps": 0.0001
                }
     """
+    if isinstance(param, SimpleNamespace):
+        return param
     default_eps = 0.0001
     if isinstance(param, str):
-        return SimpleNamespace(converge_func=param, eps=default_eps)
+        early_stop, eps = param, default_eps
     elif isinstance(param, dict):
         early_stop = param.get("early_stop", None)
         eps = param.get("eps", default_eps)
-        if not early_stop:
+        if not early_stop or not isinstance(early_stop, str):
             raise ValueError(f"early_stop config: {param} invalid")
-        return SimpleNamespace(converge_func=early_stop, eps=eps)
     else:
         raise ValueError(f"invalid type for early_stop: {type(param)}")
+    early_stop = sys.intern(early_stop)
+    if early_stop not in _CONVERGE_FUNCS:
+        raise ValueError(f"early_stop should be one of {sorted(_CONVERGE_FUNCS)}, {early_stop} given")
+    return SimpleNamespace(converge_func=early_stop, eps=eps)
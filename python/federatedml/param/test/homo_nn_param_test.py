@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+#  Copyright 2019 The FATE Authors. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import json
+import unittest
+
+from federatedml.param.homo_nn_param import HomoNNParam
+from federatedml.protobuf.generated import nn_model_meta_pb2
+
+
+class TestHomoNNParamPb(unittest.TestCase):
+    @staticmethod
+    def _round_trip(param):
+        param.check()
+        pb = nn_model_meta_pb2.HomoNNParam.FromString(param.generate_pb().SerializeToString())
+        restored = HomoNNParam()
+        restored.restore_from_pb(pb)
+        return pb, restored
+
+    def test_round_trip_with_kwargs(self):
+        kwargs = {"lr": 0.01, "betas": [0.9, 0.999], "step_size": 5, "amsgrad": True}
+        param = HomoNNParam(config_type="pytorch", nn_define=[{"layer": "Linear", "in_features": 3}],
+                            optimizer={"optimizer": "Adam", "lr": 0.01, "betas": (0.9, 0.999), "step_size": 5,
+                                       "amsgrad": True},
+                            early_stop={"early_stop": "weight_diff", "eps": 0.001},
+                            metrics=["auc", "ks"], loss="mse", batch_size=5, max_iter=3)
+        pb, restored = self._round_trip(param)
+
+        self.assertEqual(json.loads(pb.optimizer.args), kwargs)
+        self.assertEqual(restored.optimizer.optimizer, "Adam")
+        self.assertEqual(restored.optimizer.kwargs, kwargs)
+        self.assertIsInstance(restored.optimizer.kwargs["step_size"], int)
+        self.assertEqual(restored.early_stop.converge_func, "weight_diff")
+        self.assertEqual(restored.early_stop.eps, 0.001)
+        self.assertEqual(restored.nn_define, [{"layer": "Linear", "in_features": 3}])
+        self.assertEqual(restored.metrics, ["auc", "ks"])
+        self.assertEqual(restored.batch_size, 5)
+        self.assertEqual(restored.max_iter, 3)
+
+    def test_round_trip_keeps_kwargs_values_exact(self):
+        param = HomoNNParam(optimizer={"optimizer": "SGD", "lr": 1.0, "seed": 2 ** 60 + 1}, loss="mse")
+        _, restored = self._round_trip(param)
+
+        self.assertIsInstance(restored.optimizer.kwargs["lr"], float)
+        self.assertEqual(restored.optimizer.kwargs["lr"], 1.0)
+        self.assertIsInstance(restored.optimizer.kwargs["seed"], int)
+        self.assertEqual(restored.optimizer.kwargs["seed"], 2 ** 60 + 1)
+
+    def test_round_trip_empty_kwargs(self):
+        pb, restored = self._round_trip(HomoNNParam(optimizer="SGD", loss="mse"))
+
+        self.assertEqual(pb.optimizer.args, "{}")
+        self.assertEqual(restored.optimizer.optimizer, "SGD")
+        self.assertEqual(restored.optimizer.kwargs, {})
+
+    def test_restore_args_written_by_older_release(self):
+        pb = nn_model_meta_pb2.HomoNNParam(config_type="nn", loss="mse")
+        pb.early_stop.early_stop = "diff"
+        pb.optimizer.optimizer = "SGD"
+        pb.optimizer.args = json.dumps({"learning_rate": 0.05, "decay": 1})
+
+        restored = HomoNNParam()
+        restored.restore_from_pb(pb)
+        self.assertEqual(restored.optimizer.kwargs, {"learning_rate": 0.05, "decay": 1})
+
+    def test_any_backend_optimizer_name(self):
+        pb, restored = self._round_trip(HomoNNParam(config_type="keras", optimizer="Ftrl", loss="mse"))
+
+        self.assertEqual(pb.optimizer.optimizer, "Ftrl")
+        self.assertEqual(restored.optimizer.optimizer, "Ftrl")
+
+    def test_check_is_idempotent(self):
+        param = HomoNNParam(optimizer={"optimizer": "SGD", "learning_rate": 0.1}, early_stop="abs")
+        param.check()
+        optimizer, early_stop = param.optimizer, param.early_stop
+        param.check()
+        self.assertIs(param.optimizer, optimizer)
+        self.assertIs(param.early_stop, early_stop)
+
+
+if __name__ == '__main__':
+    unittest.main()